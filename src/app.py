@@ -5,95 +5,114 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import APIRouter, FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
 from pathlib import Path
 
-app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
-
-# Mount the static files directory
 current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
-
-# In-memory activity database
-activities = {
-    "Chess Club": {
-        "description": "Learn strategies and compete in chess tournaments",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-    },
-    "Programming Class": {
-        "description": "Learn programming fundamentals and build software projects",
-        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-        "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-    },
-    "Gym Class": {
-        "description": "Physical education and sports activities",
-        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-        "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-    },
-    # Sports related activities
-    "Soccer Team": {
-        "description": "Join the school soccer team and compete in matches",
-        "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-        "max_participants": 22,
-        "participants": ["alex@mergington.edu", "lucas@mergington.edu"]
-    },
-    "Basketball Club": {
-        "description": "Practice basketball skills and play friendly games",
-        "schedule": "Mondays, 3:30 PM - 5:00 PM",
-        "max_participants": 15,
-        "participants": ["mia@mergington.edu", "noah@mergington.edu"]
-    },
-    # Artistic activities
-    "Art Workshop": {
-        "description": "Explore painting, drawing, and sculpture techniques",
-        "schedule": "Thursdays, 4:00 PM - 5:30 PM",
-        "max_participants": 18,
-        "participants": ["ava@mergington.edu", "liam@mergington.edu"]
-    },
-    "Drama Club": {
-        "description": "Act, direct, and produce school plays and performances",
-        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 20,
-        "participants": ["ella@mergington.edu", "jack@mergington.edu"]
-    },
-    # Intellectual activities
-    "Math Olympiad": {
-        "description": "Prepare for math competitions and solve challenging problems",
-        "schedule": "Fridays, 4:00 PM - 5:30 PM",
-        "max_participants": 10,
-        "participants": ["ethan@mergington.edu", "isabella@mergington.edu"]
-    },
-    "Science Club": {
-        "description": "Conduct experiments and explore scientific concepts",
-        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 16,
-        "participants": ["benjamin@mergington.edu", "charlotte@mergington.edu"]
+
+router = APIRouter()
+
+
+def make_activities():
+    """Build a fresh copy of the in-memory activity database"""
+    return {
+        "Chess Club": {
+            "description": "Learn strategies and compete in chess tournaments",
+            "schedule": "Fridays, 3:30 PM - 5:00 PM",
+            "max_participants": 12,
+            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        },
+        "Programming Class": {
+            "description": "Learn programming fundamentals and build software projects",
+            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+            "max_participants": 20,
+            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        },
+        "Gym Class": {
+            "description": "Physical education and sports activities",
+            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+            "max_participants": 30,
+            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        },
+        # Sports related activities
+        "Soccer Team": {
+            "description": "Join the school soccer team and compete in matches",
+            "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
+            "max_participants": 22,
+            "participants": ["alex@mergington.edu", "lucas@mergington.edu"]
+        },
+        "Basketball Club": {
+            "description": "Practice basketball skills and play friendly games",
+            "schedule": "Mondays, 3:30 PM - 5:00 PM",
+            "max_participants": 15,
+            "participants": ["mia@mergington.edu", "noah@mergington.edu"]
+        },
+        # Artistic activities
+        "Art Workshop": {
+            "description": "Explore painting, drawing, and sculpture techniques",
+            "schedule": "Thursdays, 4:00 PM - 5:30 PM",
+            "max_participants": 18,
+            "participants": ["ava@mergington.edu", "liam@mergington.edu"]
+        },
+        "Drama Club": {
+            "description": "Act, direct, and produce school plays and performances",
+            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
+            "max_participants": 20,
+            "participants": ["ella@mergington.edu", "jack@mergington.edu"]
+        },
+        # Intellectual activities
+        "Math Olympiad": {
+            "description": "Prepare for math competitions and solve challenging problems",
+            "schedule": "Fridays, 4:00 PM - 5:30 PM",
+            "max_participants": 10,
+            "participants": ["ethan@mergington.edu", "isabella@mergington.edu"]
+        },
+        "Science Club": {
+            "description": "Conduct experiments and explore scientific concepts",
+            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+            "max_participants": 16,
+            "participants": ["benjamin@mergington.edu", "charlotte@mergington.edu"]
+        }
     }
-}
 
 
-@app.get("/")
+def create_app(activities=None):
+    """Create the FastAPI application, backed by its own activities data
+
+    Serve it with `uvicorn src.app:create_app --factory`.
+    """
+    app = FastAPI(title="Mergington High School API",
+                  description="API for viewing and signing up for extracurricular activities")
+
+    # Mount the static files directory
+    app.mount("/static", StaticFiles(directory=os.path.join(current_dir,
+              "static")), name="static")
+
+    app.include_router(router)
+
+    # In-memory activity database
+    app.state.activities = make_activities() if activities is None else activities
+    return app
+
+
+@router.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
-@app.get("/activities")
-def get_activities():
-    return activities
+@router.get("/activities")
+def get_activities(request: Request):
+    return request.app.state.activities
 
 
-@app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+@router.post("/activities/{activity_name}/signup")
+def signup_for_activity(activity_name: str, email: str, request: Request):
     """Sign up a student for an activity"""
+    activities = request.app.state.activities
+
     # Validate activity exists
     if activity_name not in activities:
         raise HTTPException(status_code=404, detail="Activity not found")
@@ -110,9 +129,11 @@ def signup_for_activity(activity_name: str, email: str):
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
-@app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+@router.delete("/activities/{activity_name}/unregister")
+def unregister_from_activity(activity_name: str, email: str, request: Request):
     """Unregister a student from an activity"""
+    activities = request.app.state.activities
+
     # Validate activity exists
     if activity_name not in activities:
         raise HTTPException(status_code=404, detail="Activity not found")
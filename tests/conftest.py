@@ -2,20 +2,61 @@
 Pytest configuration and fixtures for FastAPI testing
 """
 
+import copy
+import re
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app
 
+CATEGORY_KEYWORDS = {
+    "sports": ["soccer", "basketball", "gym", "team", "sport"],
+    "intellectual": ["math", "science", "chess", "programming", "olympiad"],
+    "artistic": ["art", "drama", "workshop"],
+}
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI application"""
-    return TestClient(app)
+# One compiled alternation per category; a name belongs to every category
+# whose pattern occurs anywhere in it, even where keywords overlap
+_CATEGORY_PATTERNS = {
+    category: re.compile("|".join(map(re.escape, keywords)))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Create an application instance owned by this test session (or xdist worker)"""
+    # Imported lazily so collecting tests doesn't build the FastAPI app
+    from src.app import create_app, make_activities
+
+    return create_app(make_activities())
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a single test client shared across the test session"""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def activities_snapshot(client):
+    """Parsed GET /activities response for the initial data, fetched once"""
+    # Requested by reset_activities, so this runs during the first test's
+    # setup before any test has changed the data. Shared by every test: read
+    # from it, never mutate it.
+    return client.get("/activities").json()
 
 
 @pytest.fixture
-def sample_activities():
-    """Sample activities data for testing"""
+def activities(app):
+    """The activities data served by the test application"""
+    return app.state.activities
+
+
+@pytest.fixture(scope="session")
+def _sample_activities_template():
+    """Sample activities data built once per session"""
     return {
         "Test Activity": {
             "description": "A test activity for testing purposes",
@@ -25,23 +66,48 @@ def sample_activities():
         },
         "Empty Activity": {
             "description": "An empty activity with no participants",
-            "schedule": "Empty schedule", 
+            "schedule": "Empty schedule",
             "max_participants": 10,
             "participants": []
         }
     }
 
 
+@pytest.fixture
+def sample_activities(_sample_activities_template):
+    """Sample activities data for testing, safe to mutate"""
+    return copy.deepcopy(_sample_activities_template)
+
+
+@pytest.fixture(scope="session")
+def lower_activity_names():
+    """Lowercased activity names, computed once per session"""
+    from src.app import make_activities
+
+    return tuple(name.lower() for name in make_activities())
+
+
+@pytest.fixture(scope="session")
+def categorize():
+    """Group lowercased activity names by the categories their keywords match"""
+    def _categorize(names):
+        return {
+            category: {name for name in names if pattern.search(name)}
+            for category, pattern in _CATEGORY_PATTERNS.items()
+        }
+
+    return _categorize
+
+
+@pytest.fixture(scope="session")
+def category_index(categorize, lower_activity_names):
+    """Lowercased activity names grouped by category, computed once per session"""
+    return categorize(lower_activity_names)
+
+
 @pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    from src.app import activities
-    
-    # Store original activities
-    original_activities = activities.copy()
-    
-    yield
-    
-    # Restore original activities after test
-    activities.clear()
-    activities.update(original_activities)
\ No newline at end of file
+def reset_activities(app, activities_snapshot):
+    """Give each test a fresh copy of the activities data"""
+    from src.app import make_activities
+
+    app.state.activities = make_activities()